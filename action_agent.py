@@ -4,9 +4,14 @@ Analyzes anomalies and creates actionable remediation plans with Slack notificat
 """
 
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+import heapq
+import itertools
+from typing import List, Dict, Any, Optional, Tuple
 import random
 
+import numpy as np
+
 # Anomaly type configurations
 ANOMALY_CONFIGS = {
     "PAINT_OVEN_IDLE": {
@@ -107,16 +112,115 @@ ANOMALY_CONFIGS = {
     }
 }
 
+# Fallback configuration for anomaly types without a dedicated entry
+DEFAULT_ANOMALY_CONFIG = {
+    "category": "Unknown",
+    "typical_fix_time": "To be determined",
+    "typical_cost": "To be estimated",
+    "severity_multiplier": 1.0,
+    "root_causes": ["Investigation required"],
+    "fix_steps": ["Analyze anomaly", "Determine root cause", "Implement fix"],
+    "responsible_team": "Maintenance Team"
+}
+
+# Electricity price per kWh used for financial impact and priority ranking
+COST_PER_KWH = 0.07
+
+# Base priority score per severity level
+SEVERITY_SCORES = {"HIGH": 80, "MEDIUM": 50, "LOW": 20}
+
+# Fixes with no parts cost (infinite ROI)
+ZERO_COST_FIXES = {
+    config["typical_cost"] for config in ANOMALY_CONFIGS.values()
+    if config["typical_cost"].startswith("$0")
+}
+
+# Priority emoji for Slack/chat messages
+PRIORITY_EMOJI = {
+    "CRITICAL": "🚨",
+    "HIGH": "⚠️",
+    "MEDIUM": "⚡",
+    "LOW": "ℹ️"
+}
+
+# Message templates (filled with str.format)
+SLACK_HEADER_TEMPLATE = """{emoji} *{level} PRIORITY ALERT*
+
+*Anomaly Detected:* {title}
+*Zone:* {zone}
+*Category:* {category}
+*Detected:* {detected}
+
+💰 *Financial Impact:*
+• Current waste: ${cost_per_day:.2f}/day
+• Annual impact: ${cost_per_year:,.0f}/year
+• Potential savings: ${savings:,.0f}/year
+
+🔧 *Action Required:*
+"""
+
+SLACK_FOOTER_TEMPLATE = """
+👥 *Responsible:* {responsible}
+⏰ *Deadline:* {urgency}
+📋 *Work Order:* {work_order_id}
+
+📊 *Expected Outcome:*
+• ROI: {roi}
+• Payback: {payback}
+
+_Generated by PlantOPS Action Agent at {generated_at}_ ⚙️"""
+
+CHAT_HEADER_TEMPLATE = """✅ Remediation plan created successfully!
+
+🚨 **{level} PRIORITY: {title}**
+
+**Zone:** {zone}
+**Impact:** Wasting ${cost_per_day:.2f}/day (${cost_per_year:,.0f}/year)
+
+**📋 Work Order:** {work_order_id}
+**⏰ Deadline:** {urgency}
+
+**🔧 Action Steps:**
+"""
+
+CHAT_FOOTER_TEMPLATE = """
+**💰 Expected Savings:** ${savings:,.0f}/year
+**📈 ROI:** {roi}
+
+**👥 Assigned to:** {responsible}
+
+_Slack notification sent to maintenance team!_
+"""
+
+STEP_TEMPLATE = "{step}. {action}\n"
+
 # Work order counter (in production, use database)
-WORK_ORDER_COUNTER = 1000
+# next() on itertools.count is atomic under the GIL, safe across threadpool workers
+_WO_COUNTER = itertools.count(1001)
+
+# (date, "YYYYMMDD") of the last generated ID
+_wo_date_cache = (None, None)
 
 
 def generate_work_order_id() -> str:
     """Generate unique work order ID"""
-    global WORK_ORDER_COUNTER
-    WORK_ORDER_COUNTER += 1
-    date_str = datetime.now().strftime("%Y%m%d")
-    return f"WO-{date_str}-{WORK_ORDER_COUNTER:04d}"
+    global _wo_date_cache
+    number = next(_WO_COUNTER)
+    today = datetime.now().date()
+    if _wo_date_cache[0] != today:
+        _wo_date_cache = (today, today.strftime("%Y%m%d"))
+    return f"WO-{_wo_date_cache[1]}-{number:04d}"
+
+
+@lru_cache(maxsize=None)
+def _priority_thresholds(severity: str, anomaly_type: str) -> Tuple[int, float]:
+    """
+    Return (base_score, severity_multiplier) for a severity/type pair
+    ANOMALY_CONFIGS is treated as read-only; call _priority_thresholds.cache_clear()
+    after changing it at runtime
+    """
+    config = ANOMALY_CONFIGS.get(anomaly_type, DEFAULT_ANOMALY_CONFIG)
+    return SEVERITY_SCORES.get(severity, 50), config.get("severity_multiplier", 1.0)
 
 
 def calculate_priority_score(
@@ -129,9 +233,8 @@ def calculate_priority_score(
     Calculate priority score and classification
     Returns: {"score": int, "priority": str, "urgency": str}
     """
-    # Base score from severity
-    severity_scores = {"HIGH": 80, "MEDIUM": 50, "LOW": 20}
-    base_score = severity_scores.get(severity, 50)
+    # Base score from severity, anomaly type multiplier
+    base_score, multiplier = _priority_thresholds(severity, anomaly_type)
     
     # Financial impact multiplier
     if cost_per_day > 50:
@@ -139,9 +242,6 @@ def calculate_priority_score(
     elif cost_per_day > 20:
         base_score += 10
     
-    # Anomaly type multiplier
-    config = ANOMALY_CONFIGS.get(anomaly_type, {})
-    multiplier = config.get("severity_multiplier", 1.0)
     final_score = int(base_score * multiplier)
     
     # Classify priority
@@ -168,7 +268,7 @@ def calculate_priority_score(
 def calculate_financial_impact(
     energy_waste_kwh: float,
     duration_hours: float = 1.0,
-    cost_per_kwh: float = 0.07
+    cost_per_kwh: float = COST_PER_KWH
 ) -> Dict[str, Any]:
     """
     Calculate financial impact of anomaly
@@ -189,6 +289,21 @@ def calculate_financial_impact(
     }
 
 
+def _display_timestamp(timestamp: Any) -> str:
+    """Format a detection timestamp for Slack/chat display"""
+    if isinstance(timestamp, datetime):
+        return timestamp.strftime('%Y-%m-%d %H:%M')
+    try:
+        return datetime.fromisoformat(timestamp).strftime('%Y-%m-%d %H:%M')
+    except (TypeError, ValueError):
+        return str(timestamp)
+
+
+def _quick_cost_per_day(energy_waste_kwh, cost_per_kwh: float = COST_PER_KWH):
+    """cost_per_day from calculate_financial_impact alone (works on arrays), for ranking"""
+    return np.round(energy_waste_kwh * cost_per_kwh * 24, 2)
+
+
 def generate_remediation_plan(anomaly_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Generate complete remediation plan for an anomaly
@@ -202,15 +317,7 @@ def generate_remediation_plan(anomaly_data: Dict[str, Any]) -> Dict[str, Any]:
     note = anomaly_data.get("note", "")
     
     # Get anomaly configuration
-    config = ANOMALY_CONFIGS.get(anomaly_type, {
-        "category": "Unknown",
-        "typical_fix_time": "To be determined",
-        "typical_cost": "To be estimated",
-        "severity_multiplier": 1.0,
-        "root_causes": ["Investigation required"],
-        "fix_steps": ["Analyze anomaly", "Determine root cause", "Implement fix"],
-        "responsible_team": "Maintenance Team"
-    })
+    config = ANOMALY_CONFIGS.get(anomaly_type, DEFAULT_ANOMALY_CONFIG)
     
     # Calculate financial impact
     financial_impact = calculate_financial_impact(energy_waste)
@@ -240,6 +347,7 @@ def generate_remediation_plan(anomaly_data: Dict[str, Any]) -> Dict[str, Any]:
             "zone": zone,
             "severity": severity,
             "detected_at": timestamp,
+            "detected_display": _display_timestamp(timestamp),
             "description": note or f"{anomaly_type.replace('_', ' ').title()} detected in {zone}"
         },
         "priority": {
@@ -272,7 +380,7 @@ def generate_remediation_plan(anomaly_data: Dict[str, Any]) -> Dict[str, Any]:
             "energy_savings_kwh_year": round(energy_waste * 24 * 365, 2),
             "cost_savings_year": financial_impact["potential_annual_savings"],
             "payback_period": "Immediate" if config["typical_cost"] == "$0 (timer adjustment)" else "< 1 month",
-            "roi_percent": "∞" if "$0" in config["typical_cost"] else "500%+"
+            "roi_percent": "∞" if config["typical_cost"] in ZERO_COST_FIXES else "500%+"
         }
     }
     
@@ -289,47 +397,32 @@ def format_slack_message(remediation_plan: Dict[str, Any]) -> str:
     steps = remediation_plan["remediation_steps"]
     outcome = remediation_plan["expected_outcome"]
     
-    # Priority emoji
-    priority_emoji = {
-        "CRITICAL": "🚨",
-        "HIGH": "⚠️",
-        "MEDIUM": "⚡",
-        "LOW": "ℹ️"
-    }
-    emoji = priority_emoji.get(priority["level"], "📋")
-    
     # Build message
-    message = f"""{emoji} *{priority['level']} PRIORITY ALERT*
-
-*Anomaly Detected:* {anomaly['type'].replace('_', ' ').title()}
-*Zone:* {anomaly['zone']}
-*Category:* {anomaly['category']}
-*Detected:* {datetime.fromisoformat(anomaly['detected_at']).strftime('%Y-%m-%d %H:%M')}
-
-💰 *Financial Impact:*
-• Current waste: ${financial['cost_per_day']:.2f}/day
-• Annual impact: ${financial['cost_per_year']:,.0f}/year
-• Potential savings: ${outcome['cost_savings_year']:,.0f}/year
-
-🔧 *Action Required:*
-"""
+    header = SLACK_HEADER_TEMPLATE.format(
+        emoji=PRIORITY_EMOJI.get(priority["level"], "📋"),
+        level=priority["level"],
+        title=anomaly["type"].replace("_", " ").title(),
+        zone=anomaly["zone"],
+        category=anomaly["category"],
+        detected=anomaly.get("detected_display") or _display_timestamp(anomaly["detected_at"]),
+        cost_per_day=financial["cost_per_day"],
+        cost_per_year=financial["cost_per_year"],
+        savings=outcome["cost_savings_year"]
+    )
     
     # Add steps
-    for step in steps:
-        message += f"{step['step']}. {step['action']}\n"
+    step_lines = [STEP_TEMPLATE.format(**step) for step in steps]
     
-    message += f"""
-👥 *Responsible:* {steps[0]['responsible']}
-⏰ *Deadline:* {priority['urgency']}
-📋 *Work Order:* {remediation_plan['work_order_id']}
-
-📊 *Expected Outcome:*
-• ROI: {outcome['roi_percent']}
-• Payback: {outcome['payback_period']}
-
-_Generated by PlantOPS Action Agent at {datetime.now().strftime('%H:%M')}_ ⚙️"""
+    footer = SLACK_FOOTER_TEMPLATE.format(
+        responsible=steps[0]["responsible"],
+        urgency=priority["urgency"],
+        work_order_id=remediation_plan["work_order_id"],
+        roi=outcome["roi_percent"],
+        payback=outcome["payback_period"],
+        generated_at=datetime.now().strftime("%H:%M")
+    )
     
-    return message
+    return "".join([header, *step_lines, footer])
 
 
 def format_chat_response(remediation_plan: Dict[str, Any]) -> str:
@@ -342,62 +435,68 @@ def format_chat_response(remediation_plan: Dict[str, Any]) -> str:
     steps = remediation_plan["remediation_steps"]
     outcome = remediation_plan["expected_outcome"]
     
-    response = f"""✅ Remediation plan created successfully!
-
-🚨 **{priority['level']} PRIORITY: {anomaly['type'].replace('_', ' ').title()}**
-
-**Zone:** {anomaly['zone']}
-**Impact:** Wasting ${financial['cost_per_day']:.2f}/day (${financial['cost_per_year']:,.0f}/year)
-
-**📋 Work Order:** {remediation_plan['work_order_id']}
-**⏰ Deadline:** {priority['urgency']}
-
-**🔧 Action Steps:**
-"""
+    header = CHAT_HEADER_TEMPLATE.format(
+        level=priority["level"],
+        title=anomaly["type"].replace("_", " ").title(),
+        zone=anomaly["zone"],
+        cost_per_day=financial["cost_per_day"],
+        cost_per_year=financial["cost_per_year"],
+        work_order_id=remediation_plan["work_order_id"],
+        urgency=priority["urgency"]
+    )
     
-    for step in steps:
-        response += f"{step['step']}. {step['action']}\n"
+    step_lines = [STEP_TEMPLATE.format(**step) for step in steps]
     
-    response += f"""
-**💰 Expected Savings:** ${outcome['cost_savings_year']:,.0f}/year
-**📈 ROI:** {outcome['roi_percent']}
-
-**👥 Assigned to:** {steps[0]['responsible']}
-
-_Slack notification sent to maintenance team!_
-"""
+    footer = CHAT_FOOTER_TEMPLATE.format(
+        savings=outcome["cost_savings_year"],
+        roi=outcome["roi_percent"],
+        responsible=steps[0]["responsible"]
+    )
     
-    return response
+    return "".join([header, *step_lines, footer])
 
 
 def get_top_priorities(anomalies: List[Dict[str, Any]], limit: int = 5) -> List[Dict[str, Any]]:
     """
     Rank anomalies by priority and return top N
+    Scores are computed in one NumPy pass; full impact is built only for the top N
     """
-    priorities = []
+    energy_waste = np.array(
+        [a.get("energy_kwh", 0) - a.get("expected_kwh", 0) for a in anomalies], dtype=float
+    )
+    candidates = np.flatnonzero(energy_waste > 0)
+    if candidates.size == 0:
+        return []
     
-    for anomaly in anomalies:
-        energy_waste = anomaly.get("energy_kwh", 0) - anomaly.get("expected_kwh", 0)
-        if energy_waste <= 0:
-            continue
-        
-        financial = calculate_financial_impact(energy_waste)
+    waste = energy_waste[candidates]
+    types = [anomalies[i].get("type", "UNKNOWN") for i in candidates]
+    
+    # Same scoring as calculate_priority_score, vectorized
+    cost_per_day = _quick_cost_per_day(waste)
+    base_score = np.where(waste > 100, SEVERITY_SCORES["HIGH"], SEVERITY_SCORES["MEDIUM"])
+    base_score = base_score + np.where(cost_per_day > 50, 20, np.where(cost_per_day > 20, 10, 0))
+    multiplier = np.array([_priority_thresholds("MEDIUM", t)[1] for t in types])
+    scores = (base_score * multiplier).astype(int)
+    
+    # Top N by priority score descending (ties keep input order)
+    top = heapq.nlargest(limit, range(candidates.size), key=scores.__getitem__)
+    
+    priorities = []
+    for j in top:
+        financial = calculate_financial_impact(float(waste[j]))
         priority_info = calculate_priority_score(
-            energy_waste,
+            float(waste[j]),
             financial["cost_per_day"],
-            "HIGH" if energy_waste > 100 else "MEDIUM",
-            anomaly.get("type", "UNKNOWN")
+            "HIGH" if waste[j] > 100 else "MEDIUM",
+            types[j]
         )
         
         priorities.append({
-            "anomaly": anomaly,
+            "anomaly": anomalies[candidates[j]],
             "priority_score": priority_info["score"],
             "priority_level": priority_info["priority"],
             "annual_savings": financial["potential_annual_savings"],
             "urgency": priority_info["urgency"]
         })
     
-    # Sort by priority score descending
-    priorities.sort(key=lambda x: x["priority_score"], reverse=True)
-    
-    return priorities[:limit]
+    return priorities
@@ -5,6 +5,137 @@ Helper functions to convert Plotly charts to shareable links
 import json
 import urllib.parse
 import base64
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+
+QUICKCHART_URL = "https://quickchart.io/chart"
+QUICKCHART_CREATE_URL = "https://quickchart.io/chart/create"
+
+# Shared session so QuickChart calls reuse keep-alive connections
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
+
+# GET URLs longer than this go through the short-URL API instead
+MAX_GET_URL_LENGTH = 2000
+
+# Short URLs keyed by a hash of the chart config (LRU, most recent last)
+_SHORT_URL_CACHE: "OrderedDict[str, str]" = OrderedDict()
+_SHORT_URL_CACHE_SIZE = 256
+_SHORT_URL_LOCK = threading.Lock()  # sync endpoints share the cache across threadpool workers
+
+
+def _quickchart_short_url(chart_config: dict) -> Optional[str]:
+    """
+    Create (or reuse) a QuickChart short URL for a chart config
+    Returns None if the QuickChart API is unreachable
+    """
+    key = hashlib.blake2b(
+        json.dumps(chart_config, sort_keys=True).encode(), digest_size=16
+    ).hexdigest()
+    
+    with _SHORT_URL_LOCK:
+        url = _SHORT_URL_CACHE.get(key)
+        if url is not None:
+            _SHORT_URL_CACHE.move_to_end(key)
+            return url
+    
+    try:
+        response = SESSION.post(
+            QUICKCHART_CREATE_URL,
+            json={"chart": chart_config, "width": 800, "height": 400},
+            timeout=5
+        )
+        response.raise_for_status()
+        url = response.json().get("url")
+    except (requests.RequestException, ValueError):
+        return None
+    
+    if url:
+        with _SHORT_URL_LOCK:
+            _SHORT_URL_CACHE[key] = url
+            _SHORT_URL_CACHE.move_to_end(key)
+            if len(_SHORT_URL_CACHE) > _SHORT_URL_CACHE_SIZE:
+                _SHORT_URL_CACHE.popitem(last=False)
+    return url
+
+
+# Line colors per trace index
+COLORS = tuple(f"rgb({i*50}, {100+i*30}, {200-i*20})" for i in range(20))
+
+
+def _build_line(chart_data: list, layout: dict) -> dict:
+    """Line chart"""
+    return {
+        "type": "line",
+        "data": {
+            "labels": chart_data[0].get('x', []),
+            "datasets": [
+                {
+                    "label": trace.get('name', 'Series'),
+                    "data": trace.get('y', []),
+                    "fill": False,
+                    "borderColor": COLORS[i % len(COLORS)]
+                }
+                for i, trace in enumerate(chart_data)
+            ]
+        },
+        "options": {
+            "title": {
+                "display": True,
+                "text": layout.get('title', {}).get('text', 'Chart')
+            }
+        }
+    }
+
+
+def _build_bar(chart_data: list, layout: dict) -> dict:
+    """Bar chart"""
+    return {
+        "type": "bar",
+        "data": {
+            "labels": chart_data[0].get('x', []),
+            "datasets": [
+                {
+                    "label": trace.get('name', 'Series'),
+                    "data": trace.get('y', [])
+                }
+                for trace in chart_data
+            ]
+        }
+    }
+
+
+def _build_pie(chart_data: list, layout: dict) -> dict:
+    """Pie chart"""
+    return {
+        "type": "pie",
+        "data": {
+            "labels": chart_data[0].get('labels', []),
+            "datasets": [{
+                "data": chart_data[0].get('values', [])
+            }]
+        }
+    }
+
+
+def _build_default(chart_data: list, layout: dict) -> dict:
+    """Default"""
+    return {"type": "line", "data": {}}
+
+
+# Plotly trace type -> Chart.js config builder
+_BUILDERS = {
+    "scatter": _build_line,
+    "bar": _build_bar,
+    "pie": _build_pie
+}
+
 
 def plotly_to_quickchart_url(plotly_config: dict) -> str:
     """
@@ -15,65 +146,22 @@ def plotly_to_quickchart_url(plotly_config: dict) -> str:
     chart_data = plotly_config.get('data', [])
     
     # Convert to Chart.js format
-    if chart_data and chart_data[0].get('type') == 'scatter':
-        # Line chart
-        chart_config = {
-            "type": "line",
-            "data": {
-                "labels": chart_data[0].get('x', []),
-                "datasets": [
-                    {
-                        "label": trace.get('name', 'Series'),
-                        "data": trace.get('y', []),
-                        "fill": False,
-                        "borderColor": f"rgb({i*50}, {100+i*30}, {200-i*20})"
-                    }
-                    for i, trace in enumerate(chart_data)
-                ]
-            },
-            "options": {
-                "title": {
-                    "display": True,
-                    "text": plotly_config.get('layout', {}).get('title', {}).get('text', 'Chart')
-                }
-            }
-        }
-    elif chart_data and chart_data[0].get('type') == 'bar':
-        # Bar chart
-        chart_config = {
-            "type": "bar",
-            "data": {
-                "labels": chart_data[0].get('x', []),
-                "datasets": [
-                    {
-                        "label": trace.get('name', 'Series'),
-                        "data": trace.get('y', [])
-                    }
-                    for trace in chart_data
-                ]
-            }
-        }
-    elif chart_data and chart_data[0].get('type') == 'pie':
-        # Pie chart
-        chart_config = {
-            "type": "pie",
-            "data": {
-                "labels": chart_data[0].get('labels', []),
-                "datasets": [{
-                    "data": chart_data[0].get('values', [])
-                }]
-            }
-        }
-    else:
-        # Default
-        chart_config = {"type": "line", "data": {}}
+    chart_type = chart_data[0].get('type') if chart_data else None
+    builder = _BUILDERS.get(chart_type, _build_default)
+    chart_config = builder(chart_data, plotly_config.get('layout', {}))
     
-    # Encode config
+    # Large configs would exceed GET limits, use a short URL
     config_json = json.dumps(chart_config)
+    if len(config_json) > MAX_GET_URL_LENGTH:
+        short_url = _quickchart_short_url(chart_config)
+        if short_url:
+            return short_url
+    
+    # Encode config
     encoded = urllib.parse.quote(config_json)
     
     # Return QuickChart URL
-    return f"https://quickchart.io/chart?c={encoded}&width=800&height=400"
+    return f"{QUICKCHART_URL}?c={encoded}&width=800&height=400"
 
 
 def plotly_to_plotly_chart_studio(plotly_config: dict) -> str:
@@ -86,29 +174,38 @@ def plotly_to_plotly_chart_studio(plotly_config: dict) -> str:
     return "https://chart-studio.plotly.com/~your-username/chart-id"
 
 
-def generate_inline_html_base64(plotly_config: dict) -> str:
-    """
-    Generate a base64-encoded HTML page with embedded chart
-    Can be opened in browser via data: URL
-    """
-    html = f"""
+# Inline HTML page around the serialized Plotly config
+_INLINE_HTML_HEAD = b"""
     <!DOCTYPE html>
     <html>
     <head>
+        <meta charset="utf-8">
         <script src="https://cdn.plot.ly/plotly-2.26.0.min.js"></script>
     </head>
     <body>
         <div id="chart" style="width:100%;height:600px;"></div>
         <script>
-            var config = {json.dumps(plotly_config)};
+            var config = """
+
+_INLINE_HTML_TAIL = b""";
             Plotly.newPlot('chart', config.data, config.layout, config.config);
         </script>
     </body>
     </html>
     """
+
+
+def generate_inline_html_base64(plotly_config: dict) -> str:
+    """
+    Generate a base64-encoded HTML page with embedded chart
+    Can be opened in browser via data: URL
+    """
+    # orjson serializes straight to UTF-8 bytes (the page declares its charset);
+    # non-str keys are stringified as json.dumps did
+    config_bytes = orjson.dumps(
+        plotly_config, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    )
+    html_bytes = b"".join((_INLINE_HTML_HEAD, config_bytes, _INLINE_HTML_TAIL))
     
     # Base64 encode
-    html_bytes = html.encode('utf-8')
-    base64_html = base64.b64encode(html_bytes).decode('utf-8')
-    
-    return f"data:text/html;base64,{base64_html}"
+    return "data:text/html;charset=utf-8;base64," + base64.b64encode(html_bytes).decode("ascii")
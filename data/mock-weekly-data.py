@@ -1,7 +1,6 @@
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
-import random
+from datetime import datetime
  
 # Simulation setup
 start_date = datetime(2025, 10, 27, 0, 0)
@@ -17,77 +16,81 @@ zones = {
     "ZONE-HVAC-UTILITIES": {"base_energy": (500, 1000), "uses_air": False, "uses_water": False}
 }
  
-records = []
+# Seeded so regenerated datasets are reproducible
+rng = np.random.default_rng(42)
+
+zone_names = np.array(list(zones))
+n_zones = len(zone_names)
+base_low = np.array([z["base_energy"][0] for z in zones.values()])
+base_high = np.array([z["base_energy"][1] for z in zones.values()])
+uses_air = np.array([z["uses_air"] for z in zones.values()])
+uses_water = np.array([z["uses_water"] for z in zones.values()])
+
+# Temperature ranges per zone (ovens and casting run hot)
+temp_ranges = {"ZONE-PAINT-SHOP": (60, 180), "ZONE-CASTING": (100, 300)}
+temp_low = np.array([temp_ranges.get(z, (18, 28))[0] for z in zone_names])
+temp_high = np.array([temp_ranges.get(z, (18, 28))[1] for z in zone_names])
+
+# Every field is drawn as an (hours, zones) array in one call
+shape = (hours, n_zones)
+hours_idx = np.arange(hours)
+shift = np.array(shifts)[(hours_idx // 8) % 3]
+night = (shift == "SHIFT-C")[:, None]
+
+# Random energy consumption
+energy = rng.uniform(base_low, base_high, size=shape)
+
+# Production pattern: day shifts have production, night less
+production = np.where(night, rng.integers(0, 11, size=shape), rng.integers(15, 31, size=shape))
+
+# Paint ovens sometimes run idle at night
+paint_idle = (zone_names == "ZONE-PAINT-SHOP") & night & (rng.random(shape) < 0.4)
+energy[paint_idle] *= 1.3  # inefficiency spike
+production[paint_idle] = 0
+
+# CO2 emission
+co2 = energy * 0.82
+
+# Compressed air
+air = np.where(uses_air, rng.uniform(500, 2000, size=shape), 0.0)
+air = np.where(production == 0, air * rng.uniform(0.5, 1.0, size=shape), air)
+
+# Water usage
+water = np.where(uses_water, rng.uniform(200, 800, size=shape), 0.0)
+
+# Temperature logic
+temperature = rng.uniform(temp_low, temp_high, size=shape)
+
+# Efficiency score (higher = better)
+baseline_energy_per_unit = 1200
+actual_energy_per_unit = energy / np.where(production > 0, production, 1)
+efficiency = np.round(np.minimum(1.0, baseline_energy_per_unit / actual_energy_per_unit), 2)
+
+status = np.where(production > 0, "OPERATIONAL", "STANDBY")
+
+timestamps = np.datetime_as_string(
+    np.datetime64(start_date, "s") + hours_idx.astype("timedelta64[h]"), unit="s"
+)
+
+# Create DataFrame (rows are hour-major, one per zone) with compact dtypes
+df = pd.DataFrame({
+    "timestamp": np.repeat(timestamps, n_zones),
+    "zone_id": pd.Categorical(np.tile(zone_names, hours), categories=zone_names),
+    "energy_kwh": np.round(energy, 2).ravel().astype(np.float32),
+    "co2_kg": np.round(co2, 2).ravel().astype(np.float32),
+    "production_units": production.ravel().astype(np.int16),
+    "compressed_air_m3": np.round(air, 2).ravel().astype(np.float32),
+    "water_liters": np.round(water, 2).ravel().astype(np.float32),
+    "temperature_c": np.round(temperature, 1).ravel().astype(np.float32),
+    "shift": pd.Categorical(np.repeat(shift, n_zones), categories=shifts),
+    "efficiency_score": efficiency.ravel().astype(np.float32),
+    "status": pd.Categorical(status.ravel(), categories=["OPERATIONAL", "STANDBY"])
+})
  
-for hour in range(hours):
-    timestamp = start_date + timedelta(hours=hour)
-    shift = shifts[(hour // 8) % 3]
- 
-    for zone, zdata in zones.items():
-        # Random energy consumption
-        energy = random.uniform(*zdata["base_energy"])
-        
-        # Production pattern: day shifts have production, night less
-        if shift == "SHIFT-C":
-            production = random.randint(0, 10)
-        else:
-            production = random.randint(15, 30)
-        
-        # Paint ovens sometimes run idle at night
-        if zone == "ZONE-PAINT-SHOP" and shift == "SHIFT-C" and random.random() < 0.4:
-            energy *= 1.3  # inefficiency spike
-            production = 0
-        
-        # CO2 emission
-        co2 = energy * 0.82
-        
-        # Compressed air
-        air = random.uniform(500, 2000) if zdata["uses_air"] else 0
-        if production == 0:
-            air *= random.uniform(0.5, 1.0)
-        
-        # Water usage
-        water = random.uniform(200, 800) if zdata["uses_water"] else 0
-        
-        # Temperature logic
-        temperature = random.uniform(18, 28)
-        if zone == "ZONE-PAINT-SHOP":
-            temperature = random.uniform(60, 180)  # oven
-        elif zone == "ZONE-CASTING":
-            temperature = random.uniform(100, 300)
-        
-        # Efficiency score (higher = better)
-        baseline_energy_per_unit = 1200
-        actual_energy_per_unit = energy / (production if production > 0 else 1)
-        efficiency = round(min(1.0, baseline_energy_per_unit / actual_energy_per_unit), 2)
-        
-        status = "OPERATIONAL" if production > 0 else "STANDBY"
-        
-        records.append([
-            timestamp.strftime("%Y-%m-%dT%H:%M:%S"),
-            zone,
-            round(energy, 2),
-            round(co2, 2),
-            production,
-            round(air, 2),
-            round(water, 2),
-            round(temperature, 1),
-            shift,
-            efficiency,
-            status
-        ])
- 
-# Create DataFrame
-cols = ["timestamp", "zone_id", "energy_kwh", "co2_kg", "production_units",
-        "compressed_air_m3", "water_liters", "temperature_c", "shift",
-        "efficiency_score", "status"]
- 
-df = pd.DataFrame(records, columns=cols)
- 
-# Compute zone energy share
-total_energy = df["energy_kwh"].sum()
-zone_share = df.groupby("zone_id")["energy_kwh"].sum() / total_energy * 100
-df["zone_energy_share_%"] = df["zone_id"].map(zone_share.round(2))
+# Compute zone energy share (from the float64 energies, before the downcast)
+zone_energy = np.round(energy, 2).sum(axis=0)
+zone_share = np.round(zone_energy / zone_energy.sum() * 100, 2)
+df["zone_energy_share_%"] = np.tile(zone_share, hours)
  
 # Save to CSV
 df.to_csv("automotive_energy_data.csv", index=False)
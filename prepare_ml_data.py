@@ -10,8 +10,16 @@ import numpy as np
 from datetime import datetime
 import os
 
+# Labels as categoricals, unit counts as int32; measurements stay float64
+DTYPES = {
+    "zone_id": "category",
+    "shift": "category",
+    "status": "category",
+    "production_units": "int32"
+}
+
 # Load the automotive data
-df = pd.read_csv("data/automotive_energy_data.csv", parse_dates=["timestamp"])
+df = pd.read_csv("data/automotive_energy_data.csv", parse_dates=["timestamp"], dtype=DTYPES)
 
 print("=" * 60)
 print("📊 Preparing ML Training Data for watsonx.ai")
@@ -32,47 +40,34 @@ anomaly_features['is_night_shift'] = (anomaly_features['shift'] == 'SHIFT-C').as
 anomaly_features['is_operational'] = (anomaly_features['status'] == 'OPERATIONAL').astype(int)
 
 # Calculate derived features
-anomaly_features['energy_per_unit'] = np.where(
-    anomaly_features['production_units'] > 0,
-    anomaly_features['energy_kwh'] / anomaly_features['production_units'],
-    anomaly_features['energy_kwh']
-)
-
-anomaly_features['air_per_unit'] = np.where(
-    anomaly_features['production_units'] > 0,
-    anomaly_features['compressed_air_m3'] / anomaly_features['production_units'],
-    anomaly_features['compressed_air_m3']
-)
+# (rows without production keep the raw value; only producing rows are divided)
+produced_units = anomaly_features['production_units'].to_numpy()
+has_units = produced_units > 0
+for column, feature in (('energy_kwh', 'energy_per_unit'), ('compressed_air_m3', 'air_per_unit')):
+    values = anomaly_features[column].to_numpy(dtype=float)
+    anomaly_features[feature] = np.divide(values, produced_units, out=values.copy(), where=has_units)
 
 # Label anomalies (using our existing rule-based logic as ground truth)
-def label_anomaly(row):
-    """Label data as anomaly (1) or normal (0)"""
-    
-    # Paint oven idle
-    if 'PAINT' in row['zone_id']:
-        if row['production_units'] == 0 and row['energy_kwh'] > 3000:
-            return 1
-    
-    # Compressed air leak
-    if row['production_units'] <= 1 and row['compressed_air_m3'] > 1500:
-        return 1
-    
-    # HVAC overcooling
-    if row['temperature_c'] < 19 and row['production_units'] <= 1:
-        return 1
-    
-    # Standby power waste
-    if row['status'] == 'STANDBY' and row['energy_kwh'] > 500:
-        return 1
-    
-    # Energy per vehicle high
-    if row['production_units'] > 0:
-        if row['energy_per_unit'] > 1200:
-            return 1
-    
-    return 0
-
-anomaly_features['is_anomaly'] = anomaly_features.apply(label_anomaly, axis=1)
+# Each rule is a vectorized mask; a row is an anomaly (1) if any rule matches, else normal (0)
+units = anomaly_features['production_units']
+energy = anomaly_features['energy_kwh']
+
+# Zone codes are shared by the paint-oven rule and the zone_encoded feature
+zones = anomaly_features['zone_id'].cat
+zone_codes = zones.codes.to_numpy()
+paint_codes = [code for code, zone in enumerate(zones.categories) if 'PAINT' in zone]
+zone_is_paint = np.isin(zone_codes, paint_codes)
+
+paint_oven_idle = zone_is_paint & (units == 0) & (energy > 3000)
+compressed_air_leak = (units <= 1) & (anomaly_features['compressed_air_m3'] > 1500)
+hvac_overcooling = (anomaly_features['temperature_c'] < 19) & (units <= 1)
+standby_power_waste = (anomaly_features['status'] == 'STANDBY') & (energy > 500)
+energy_per_vehicle_high = (units > 0) & (anomaly_features['energy_per_unit'] > 1200)
+
+anomaly_features['is_anomaly'] = (
+    paint_oven_idle | compressed_air_leak | hvac_overcooling |
+    standby_power_waste | energy_per_vehicle_high
+).astype(int)
 
 # Select final features for training
 ml_features = [
@@ -85,7 +80,7 @@ ml_features = [
 anomaly_dataset = anomaly_features[ml_features].copy()
 
 # Encode zone_id separately (will handle in model)
-anomaly_dataset['zone_encoded'] = pd.Categorical(anomaly_features['zone_id']).codes
+anomaly_dataset['zone_encoded'] = zone_codes
 
 # Save
 os.makedirs('data/ml_training', exist_ok=True)
@@ -116,16 +111,24 @@ ts_data = ts_data.sort_values('timestamp')
 # Add time features
 ts_data['hour'] = ts_data['timestamp'].dt.hour
 ts_data['day_of_week'] = ts_data['timestamp'].dt.dayofweek
-ts_data['is_weekend'] = ts_data['day_of_week'].isin([5, 6]).astype(int)
+ts_data['is_weekend'] = (ts_data['day_of_week'].to_numpy() >= 5).astype(int)
 
-# Create lag features (for ML-based forecasting)
+# Create lag features (for ML-based forecasting), sliced from the raw
+# arrays and attached in one concat
+energies = ts_data['energy_kwh'].to_numpy(dtype=float)
+production = ts_data['production_units'].to_numpy(dtype=float)
+lag_columns = {}
 for lag in [1, 2, 3, 6, 12, 24]:
-    ts_data[f'energy_lag_{lag}h'] = ts_data['energy_kwh'].shift(lag)
-    ts_data[f'production_lag_{lag}h'] = ts_data['production_units'].shift(lag)
+    for name, values in (('energy', energies), ('production', production)):
+        lagged = np.full(len(values), np.nan)
+        lagged[lag:] = values[:-lag]
+        lag_columns[f'{name}_lag_{lag}h'] = lagged
+ts_data = pd.concat([ts_data, pd.DataFrame(lag_columns, index=ts_data.index)], axis=1)
 
 # Rolling statistics
-ts_data['energy_rolling_mean_6h'] = ts_data['energy_kwh'].rolling(window=6, min_periods=1).mean()
-ts_data['energy_rolling_std_6h'] = ts_data['energy_kwh'].rolling(window=6, min_periods=1).std()
+energy_rolling = ts_data['energy_kwh'].rolling(window=6, min_periods=1)
+ts_data['energy_rolling_mean_6h'] = energy_rolling.mean()
+ts_data['energy_rolling_std_6h'] = energy_rolling.std()
 
 # Drop NaN from lag features
 ts_data = ts_data.dropna()
@@ -142,19 +145,20 @@ print(f"   📅 Date range: {ts_data['timestamp'].min()} to {ts_data['timestamp'
 # ========================================
 print("\n3️⃣  Creating Zone-Specific Datasets...")
 
+# Time features and per-zone lags for all zones in one pass
+zone_df = df.sort_values(['zone_id', 'timestamp'])
+zone_df['hour'] = zone_df['timestamp'].dt.hour
+zone_df['day_of_week'] = zone_df['timestamp'].dt.dayofweek
+
+zone_energy = zone_df.groupby('zone_id', observed=True)['energy_kwh']
+for lag in [1, 2, 3, 6]:
+    zone_df[f'energy_lag_{lag}h'] = zone_energy.shift(lag)
+
+zone_df = zone_df.dropna()
+zone_groups = dict(iter(zone_df.groupby('zone_id', observed=True)))
+
 for zone in df['zone_id'].unique():
-    zone_data = df[df['zone_id'] == zone].copy()
-    zone_data = zone_data.sort_values('timestamp')
-    
-    # Add time features
-    zone_data['hour'] = zone_data['timestamp'].dt.hour
-    zone_data['day_of_week'] = zone_data['timestamp'].dt.dayofweek
-    
-    # Lag features
-    for lag in [1, 2, 3, 6]:
-        zone_data[f'energy_lag_{lag}h'] = zone_data['energy_kwh'].shift(lag)
-    
-    zone_data = zone_data.dropna()
+    zone_data = zone_groups.get(zone, zone_df.iloc[:0])
     
     # Save
     zone_name = zone.replace('ZONE-', '').lower()
@@ -114,7 +114,11 @@ try:
     import pandas as pd
     
     # Load data
-    df = pd.read_csv("data/automotive_energy_data.csv", parse_dates=["timestamp"])
+    df = pd.read_csv(
+        "data/automotive_energy_data.csv",
+        parse_dates=["timestamp"],
+        dtype={"zone_id": "category", "shift": "category", "status": "category", "production_units": "int32"}
+    )
     print(f"   ✅ Loaded {len(df)} records from CSV")
     
     # Test feature preparation
@@ -142,7 +146,7 @@ if os.getenv("ANOMALY_DEPLOYMENT_ID"):
     print("\n5️⃣ Testing Anomaly Detection Model...")
     try:
         predictions = wml_client.predict_anomalies(sample_data)
-        anomaly_count = sum([1 for p in predictions if p['is_anomaly']])
+        anomaly_count = sum(1 for p in predictions if p['is_anomaly'])
         print(f"   ✅ Model predictions successful")
         print(f"   ℹ️  Detected {anomaly_count} anomalies in {len(predictions)} samples")
     except Exception as e:
@@ -155,7 +159,7 @@ if os.getenv("FORECAST_DEPLOYMENT_ID"):
     print("\n6️⃣ Testing Energy Forecasting Model...")
     try:
         forecasts = wml_client.predict_energy(df.head(50), hours_ahead=6)
-        total_forecast = sum([f['predicted_energy_kwh'] for f in forecasts])
+        total_forecast = sum(f['predicted_energy_kwh'] for f in forecasts)
         print(f"   ✅ Forecast successful")
         print(f"   ℹ️  Predicted {total_forecast:.0f} kWh over next 6 hours")
     except Exception as e:
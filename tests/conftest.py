@@ -0,0 +1,7 @@
+import os
+import sys
+
+# Modules live in the repo root and main.py loads its CSV from a relative path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
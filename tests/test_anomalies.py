@@ -0,0 +1,27 @@
+import main
+
+
+def _standby_waste(data_df):
+    return [a for a in main.detect_anomalies(data_df) if a["type"] == "STANDBY_POWER_WASTE"]
+
+
+def test_standby_rule_falls_back_to_default_baseline_without_operational_rows():
+    # status=STANDBY leaves no operational rows, so every zone's operational median
+    # is missing and the rule compares against the 1.0 kWh default
+    data = main.filter_data(main.df, status="STANDBY")
+    waste = _standby_waste(data)
+
+    expected = data[data["energy_kwh"] > main.CONFIG["STANDBY_ENERGY_PERCENT"] * 1.0]
+    assert len(waste) == len(expected) == 56
+    assert {a["operational_median"] for a in waste} == {1.0}
+    assert {(a["zone"], a["timestamp"]) for a in waste} == {
+        (zone, ts.isoformat()) for zone, ts in zip(expected["zone_id"], expected["timestamp"])
+    }
+    assert waste[0] == {
+        "type": "STANDBY_POWER_WASTE",
+        "zone": "ZONE-ASSEMBLY",
+        "timestamp": "2025-10-27T20:00:00",
+        "energy_kwh": 1390.78,
+        "operational_median": 1.0,
+        "note": "Standby energy 1390.78kWh is > 15.0% of operational median (1.0 kWh).",
+    }
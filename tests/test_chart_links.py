@@ -0,0 +1,23 @@
+import base64
+
+from chart_links import generate_inline_html_base64
+
+
+def _decode(data_url):
+    header, payload = data_url.split(",", 1)
+    return header, base64.b64decode(payload).decode("utf-8")
+
+
+def test_inline_html_round_trips_non_ascii_title():
+    header, html = _decode(generate_inline_html_base64({
+        "data": [],
+        "layout": {"title": "Energy & CO₂ Trends"}
+    }))
+    assert header == "data:text/html;charset=utf-8;base64"
+    assert '<meta charset="utf-8">' in html
+    assert "Energy & CO₂ Trends" in html
+
+
+def test_inline_html_accepts_non_str_keys():
+    _, html = _decode(generate_inline_html_base64({"data": [], "layout": {1: "a"}}))
+    assert '{"1":"a"}' in html
@@ -7,6 +7,7 @@ from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel, Field
 from typing import List, Dict, Any, Optional
 import pandas as pd
+import time
 from datetime import datetime
 
 # Pydantic models for chart requests
@@ -246,6 +247,18 @@ def generate_kpi_cards(kpis: dict) -> List[dict]:
     return cards
 
 
+# Dashboard render timestamp, reused for up to a second across bursts of renders
+_DASHBOARD_TIMESTAMP = [float("-inf"), ""]
+
+def dashboard_timestamp() -> str:
+    """Current local time in ISO format, refreshed at most once per second"""
+    now = time.monotonic()
+    if now - _DASHBOARD_TIMESTAMP[0] >= 1.0:
+        _DASHBOARD_TIMESTAMP[0] = now
+        _DASHBOARD_TIMESTAMP[1] = datetime.now().isoformat()
+    return _DASHBOARD_TIMESTAMP[1]
+
+
 def generate_dashboard_config(kpis: dict, trend_data: dict, zone_data: dict, anomaly_count: int) -> dict:
     """
     Generate complete dashboard configuration
@@ -253,7 +266,7 @@ def generate_dashboard_config(kpis: dict, trend_data: dict, zone_data: dict, ano
     """
     return {
         "title": "Plant Sustainability Dashboard",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": dashboard_timestamp(),
         "kpi_cards": generate_kpi_cards(kpis),
         "charts": [
             {
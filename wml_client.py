@@ -4,52 +4,118 @@ Handles interactions with deployed ML models
 """
 
 from ibm_watsonx_ai import APIClient
+import hashlib
 import os
-from typing import List, Dict, Any
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from typing import List, Dict, Any, Optional, Tuple
 import pandas as pd
 import numpy as np
+import anyio
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Zones in training order: prepare_ml_data.py encodes zone_id with category codes,
+# i.e. positions in the sorted list of zone ids
+DEFAULT_ZONE_VOCABULARY = [
+    'ZONE-ASSEMBLY', 'ZONE-BATTERY', 'ZONE-BODY-SHOP',
+    'ZONE-CASTING', 'ZONE-HVAC-UTILITIES', 'ZONE-PAINT-SHOP'
+]
+
+@dataclass(frozen=True)
+class WatsonxConfig:
+    """watsonx.ai settings read from the environment (.env)"""
+    api_key: str
+    url: str
+    space_id: Optional[str]
+    project_id: Optional[str]
+    anomaly_deployment_id: Optional[str]
+    forecast_deployment_id: Optional[str]
+    # Large anomaly payloads are scored in batches, a few requests in flight at once
+    score_batch_size: int
+    max_concurrency: int
+    # Deployment details change only on redeploy; reuse them for a few minutes
+    model_info_ttl: float
+    # Identical model inputs score identically; keep recent results (LRU with a TTL)
+    prediction_cache_ttl: float
+    prediction_cache_size: int
+    # zone_id -> zone_encoded lookup (must match training data; comma-separated override)
+    zone_vocabulary: Tuple[str, ...]
+
+@lru_cache(maxsize=1)
+def load_config() -> WatsonxConfig:
+    """Read and validate the watsonx.ai settings once per process (invalid settings are not cached)"""
+    api_key = os.getenv("WATSONX_API_KEY")
+    project_id = os.getenv("WATSONX_PROJECT_ID")
+    space_id = os.getenv("WATSONX_SPACE_ID")
+    
+    if not api_key:
+        raise ValueError(
+            "Missing watsonx.ai credentials. "
+            "Set WATSONX_API_KEY in .env file"
+        )
+    if not (space_id or project_id):
+        raise ValueError(
+            "Must set either WATSONX_SPACE_ID or WATSONX_PROJECT_ID in .env file"
+        )
+    
+    zone_vocabulary = os.getenv("ZONE_VOCABULARY")
+    return WatsonxConfig(
+        api_key=api_key,
+        url=os.getenv("WATSONX_URL", "https://us-south.ml.cloud.ibm.com"),
+        space_id=space_id,
+        project_id=project_id,
+        anomaly_deployment_id=os.getenv("ANOMALY_DEPLOYMENT_ID"),
+        forecast_deployment_id=os.getenv("FORECAST_DEPLOYMENT_ID"),
+        score_batch_size=int(os.getenv("WATSONX_SCORE_BATCH_SIZE", "1024")),
+        max_concurrency=int(os.getenv("WATSONX_MAX_CONCURRENCY", "4")),
+        model_info_ttl=float(os.getenv("WATSONX_MODEL_INFO_TTL", "300")),
+        prediction_cache_ttl=float(os.getenv("WATSONX_PREDICTION_CACHE_TTL", "3600")),
+        prediction_cache_size=int(os.getenv("WATSONX_PREDICTION_CACHE_SIZE", "256")),
+        zone_vocabulary=tuple(
+            [zone.strip() for zone in zone_vocabulary.split(",")]
+            if zone_vocabulary else DEFAULT_ZONE_VOCABULARY
+        )
+    )
+
 class WatsonxMLClient:
     """Client for watsonx.ai model inference"""
     
     def __init__(self):
         """Initialize watsonx.ai client with credentials"""
-        api_key = os.getenv("WATSONX_API_KEY")
-        project_id = os.getenv("WATSONX_PROJECT_ID")
-        space_id = os.getenv("WATSONX_SPACE_ID")
-        url = os.getenv("WATSONX_URL", "https://us-south.ml.cloud.ibm.com")
-        
-        if not api_key:
-            raise ValueError(
-                "Missing watsonx.ai credentials. "
-                "Set WATSONX_API_KEY in .env file"
-            )
-        
-        # Initialize credentials (newer API format)
-        wml_credentials = {
-            "url": url,
-            "apikey": api_key
-        }
+        config = load_config()
         
-        # Initialize client
-        self.client = APIClient(wml_credentials)
+        # Initialize client (newer API credentials format)
+        self.client = APIClient({
+            "url": config.url,
+            "apikey": config.api_key
+        })
         
         # Use space for deployments, project for training
-        if space_id:
-            self.client.set.default_space(space_id)
-        elif project_id:
-            self.client.set.default_project(project_id)
+        if config.space_id:
+            self.client.set.default_space(config.space_id)
         else:
-            raise ValueError(
-                "Must set either WATSONX_SPACE_ID or WATSONX_PROJECT_ID in .env file"
-            )
+            self.client.set.default_project(config.project_id)
         
         # Deployment IDs
-        self.anomaly_deployment_id = os.getenv("ANOMALY_DEPLOYMENT_ID")
-        self.forecast_deployment_id = os.getenv("FORECAST_DEPLOYMENT_ID")
+        self.anomaly_deployment_id = config.anomaly_deployment_id
+        self.forecast_deployment_id = config.forecast_deployment_id
+        
+        self.score_batch_size = config.score_batch_size
+        self.max_concurrency = config.max_concurrency
+        
+        self.model_info_ttl = config.model_info_ttl
+        self._details_cache = {}  # deployment_id -> (fetched_at, details)
+        
+        self.prediction_cache_ttl = config.prediction_cache_ttl
+        self.prediction_cache_size = config.prediction_cache_size
+        self._prediction_cache = OrderedDict()  # key -> (stored_at, result)
+        self._prediction_lock = threading.Lock()
         
         # Feature names (must match training data)
         self.anomaly_features = [
@@ -65,8 +131,47 @@ class WatsonxMLClient:
             'energy_lag_1h', 'production_lag_1h'
         ]
         
+        # Column positions in a forecast feature row
+        self.forecast_feature_index = {name: i for i, name in enumerate(self.forecast_features)}
+        
+        # zone_id -> zone_encoded lookup
+        self.zone_index = pd.Index(list(config.zone_vocabulary))
+        
         print("✅ WatsonxMLClient initialized successfully")
     
+    @staticmethod
+    def hour_and_day_of_week(timestamps: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+        """Hour of day and day of week (Monday=0) from one pass over the timestamps"""
+        hours = timestamps.to_numpy().astype('datetime64[h]').astype(np.int64)
+        # Hours since the epoch; 1970-01-01 was a Thursday (day 3)
+        return hours % 24, (hours // 24 + 3) % 7
+    
+    @staticmethod
+    def _prediction_key(deployment_id: str, values: np.ndarray, *extra) -> tuple:
+        """Cache key for a model input: deployment, matrix shape and a BLAKE2b digest of its bytes"""
+        digest = hashlib.blake2b(np.ascontiguousarray(values).tobytes(), digest_size=16).hexdigest()
+        return (deployment_id, values.shape, digest) + extra
+    
+    def _cached_prediction(self, key: tuple) -> Any:
+        """Result stored under key, or None if missing or older than prediction_cache_ttl"""
+        with self._prediction_lock:
+            entry = self._prediction_cache.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] >= self.prediction_cache_ttl:
+                del self._prediction_cache[key]
+                return None
+            self._prediction_cache.move_to_end(key)
+            return entry[1]
+    
+    def _store_prediction(self, key: tuple, result: Any) -> None:
+        """Store a result, evicting the least recently used ones past prediction_cache_size"""
+        with self._prediction_lock:
+            self._prediction_cache[key] = (time.monotonic(), result)
+            self._prediction_cache.move_to_end(key)
+            while len(self._prediction_cache) > self.prediction_cache_size:
+                self._prediction_cache.popitem(last=False)
+    
     def prepare_anomaly_features(self, data_df: pd.DataFrame) -> pd.DataFrame:
         """
         Prepare features for anomaly detection model
@@ -77,29 +182,22 @@ class WatsonxMLClient:
         Returns:
             DataFrame with model-ready features
         """
-        df = data_df.copy()
+        df = data_df.copy(deep=False)  # only whole columns are added below
         
         # Add time-based features
-        df['hour'] = df['timestamp'].dt.hour
-        df['day_of_week'] = df['timestamp'].dt.dayofweek
+        df['hour'], df['day_of_week'] = self.hour_and_day_of_week(df['timestamp'])
         df['is_night_shift'] = (df['shift'] == 'SHIFT-C').astype(int)
         df['is_operational'] = (df['status'] == 'OPERATIONAL').astype(int)
         
-        # Calculate derived features
-        df['energy_per_unit'] = np.where(
-            df['production_units'] > 0,
-            df['energy_kwh'] / df['production_units'],
-            df['energy_kwh']
-        )
+        # Calculate derived features (rows without production keep the raw value)
+        units = df['production_units'].to_numpy()
+        has_units = units > 0
+        for column, feature in (('energy_kwh', 'energy_per_unit'), ('compressed_air_m3', 'air_per_unit')):
+            values = df[column].to_numpy(dtype=float)
+            df[feature] = np.divide(values, units, out=values.copy(), where=has_units)
         
-        df['air_per_unit'] = np.where(
-            df['production_units'] > 0,
-            df['compressed_air_m3'] / df['production_units'],
-            df['compressed_air_m3']
-        )
-        
-        # Encode zone_id
-        df['zone_encoded'] = pd.Categorical(df['zone_id']).codes
+        # Encode zone_id with the training-time codes (-1 for zones the model never saw)
+        df['zone_encoded'] = self.zone_index.get_indexer(df['zone_id'])
         
         return df[self.anomaly_features]
     
@@ -113,107 +211,167 @@ class WatsonxMLClient:
         Returns:
             DataFrame with model-ready features
         """
-        df = data_df.copy()
+        df = data_df.copy(deep=False)  # only whole columns are added below
         
         # Add time features
-        df['hour'] = df['timestamp'].dt.hour
-        df['day_of_week'] = df['timestamp'].dt.dayofweek
-        df['is_weekend'] = df['day_of_week'].isin([5, 6]).astype(int)
+        df['hour'], df['day_of_week'] = self.hour_and_day_of_week(df['timestamp'])
+        df['is_weekend'] = (df['day_of_week'].to_numpy() >= 5).astype(int)
         
         # Calculate CO2 if not present (assuming energy-based calculation)
         if 'co2_kg' not in df.columns:
             # Average emission factor: ~0.82 kg CO2 per kWh (can adjust based on region)
             df['co2_kg'] = df['energy_kwh'] * 0.82
         
-        # Create lag features (only 1h for production and energy)
-        df['energy_lag_1h'] = df['energy_kwh'].shift(1)
-        df['production_lag_1h'] = df['production_units'].shift(1)
-        
-        # Drop NaN from lag features
-        df = df.dropna()
+        # Create lag features (only 1h for production and energy); the first hour
+        # has no previous one and uses its own value, so no row is dropped
+        for column, lag_column in (('energy_kwh', 'energy_lag_1h'), ('production_units', 'production_lag_1h')):
+            values = df[column]
+            df[lag_column] = values.shift(1, fill_value=values.iloc[0] if len(values) else 0)
         
         # Return only the features the model expects
         return df[self.forecast_features]
     
-    def predict_anomalies(self, data_df: pd.DataFrame) -> List[Dict[str, Any]]:
+    def score_anomalies(self, data_df: pd.DataFrame) -> Dict[str, Any]:
         """
-        Detect anomalies using ML model
+        Score rows with the anomaly model, keeping results as arrays
         
         Args:
             data_df: DataFrame with operational data
             
         Returns:
-            List of anomaly predictions with scores
+            Dict with 'scores' (anomaly probability per row), 'is_anomaly'
+            (bool per row) and 'meta' (the scored rows of data_df)
         """
         if not self.anomaly_deployment_id:
             raise ValueError("ANOMALY_DEPLOYMENT_ID not set in .env")
         
         # Prepare features
         features_df = self.prepare_anomaly_features(data_df)
+        values = features_df.values
+        
+        # Reuse a recent result for the same feature matrix
+        cache_key = self._prediction_key(self.anomaly_deployment_id, values)
+        cached = self._cached_prediction(cache_key)
+        if cached is not None:
+            scores, is_anomaly = cached
+            return {
+                'scores': scores,
+                'is_anomaly': is_anomaly,
+                'meta': data_df.iloc[:len(scores)]
+            }
         
-        # Prepare payload for watsonx.ai
-        payload = {
-            "input_data": [{
-                "fields": self.anomaly_features,
-                "values": features_df.values.tolist()
-            }]
-        }
+        # Prepare payloads for watsonx.ai (one per batch of rows)
+        batches = [
+            values[start:start + self.score_batch_size]
+            for start in range(0, len(values), self.score_batch_size)
+        ] or [values]
+        payloads = [
+            {
+                "input_data": [{
+                    "fields": self.anomaly_features,
+                    "values": batch.tolist()
+                }]
+            }
+            for batch in batches
+        ]
         
         # Get predictions
         try:
-            response = self.client.deployments.score(
-                self.anomaly_deployment_id, 
-                payload
-            )
+            score = partial(self.client.deployments.score, self.anomaly_deployment_id)
+            if len(payloads) == 1:
+                responses = [score(payloads[0])]
+            else:
+                with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(payloads))) as executor:
+                    responses = list(executor.map(score, payloads))  # in submission order
             
             # DEBUG: Print first prediction to understand format
-            predictions = response['predictions'][0]
+            predictions = responses[0]['predictions'][0]
             print(f"DEBUG - Prediction keys: {predictions.keys()}")
             print(f"DEBUG - First 3 predictions: {predictions['values'][:3]}")
             if 'fields' in predictions:
                 print(f"DEBUG - Fields: {predictions['fields']}")
             
             # Parse response - AutoAI format
-            pred_values = predictions['values']
-            pred_fields = predictions.get('fields', [])
+            pred_values = [
+                row
+                for response in responses
+                for row in response['predictions'][0]['values']
+            ]
+            if len(pred_values) > len(data_df):
+                raise IndexError("more predictions than input rows")
             
-            # Combine with original data
-            results = []
-            for idx, pred_row in enumerate(pred_values):
-                row = data_df.iloc[idx]
-                
-                # AutoAI format: [prediction, [probability_0, probability_1]]
-                # Example: [0.0, [0.996, 0.004]] means class 0 with 99.6% confidence
-                if isinstance(pred_row, list) and len(pred_row) >= 2:
-                    prediction = pred_row[0]  # 0.0 or 1.0
-                    
-                    # Extract probabilities
-                    if isinstance(pred_row[1], list) and len(pred_row[1]) >= 2:
-                        prob_class_0 = pred_row[1][0]  # Probability of normal (class 0)
-                        prob_class_1 = pred_row[1][1]  # Probability of anomaly (class 1)
-                        anomaly_score = prob_class_1
-                    else:
-                        anomaly_score = 0.5
-                else:
-                    prediction = pred_row if not isinstance(pred_row, list) else pred_row[0]
-                    anomaly_score = 0.5
-                
-                results.append({
-                    'timestamp': row['timestamp'].isoformat(),
-                    'zone_id': row['zone_id'],
-                    'is_anomaly': bool(prediction == 1.0),  # 1.0 = anomaly, 0.0 = normal
-                    'anomaly_score': float(anomaly_score),  # Probability of anomaly
-                    'energy_kwh': float(row['energy_kwh']),
-                    'production_units': int(row['production_units']),
-                    'shift': row['shift'],
-                    'status': row['status']
-                })
+            # AutoAI format: [prediction, [probability_0, probability_1]]
+            # Example: [0.0, [0.996, 0.004]] means class 0 with 99.6% confidence
+            count = len(pred_values)
+            classes = [row[0] if isinstance(row, list) else row for row in pred_values]  # 0.0 or 1.0
             
-            return results
+            # Probability of anomaly (class 1), 0.5 when the model gives none
+            scores = np.array([
+                row[1][1]
+                if isinstance(row, list) and len(row) >= 2 and isinstance(row[1], list) and len(row[1]) >= 2
+                else 0.5
+                for row in pred_values
+            ], dtype=np.float64)
+            is_anomaly = np.fromiter((c == 1.0 for c in classes), dtype=bool, count=count)  # 1.0 = anomaly, 0.0 = normal
+            
+            # Cached arrays are shared between callers
+            scores.flags.writeable = False
+            is_anomaly.flags.writeable = False
+            self._store_prediction(cache_key, (scores, is_anomaly))
+            
+            return {
+                'scores': scores,
+                'is_anomaly': is_anomaly,
+                'meta': data_df.iloc[:len(pred_values)]
+            }
             
         except Exception as e:
             raise RuntimeError(f"Anomaly prediction failed: {str(e)}")
     
+    @staticmethod
+    def anomaly_records(result: Dict[str, Any], mask: Optional[np.ndarray] = None) -> List[Dict[str, Any]]:
+        """Build prediction dicts for the rows of a score_anomalies result selected by mask (bool or positions)"""
+        meta, scores, is_anomaly = result['meta'], result['scores'], result['is_anomaly']
+        if mask is not None:
+            meta, scores, is_anomaly = meta.iloc[mask], scores[mask], is_anomaly[mask]
+        # ISO timestamps formatted in one NumPy call (isoformat() only if sub-second values appear)
+        stamps = meta['timestamp'].to_numpy()
+        seconds = stamps.astype('datetime64[s]')
+        if (seconds == stamps).all():
+            timestamps = np.datetime_as_string(seconds).tolist()
+        else:
+            timestamps = [ts.isoformat() for ts in meta['timestamp'].tolist()]
+        return [
+            {
+                'timestamp': ts,
+                'zone_id': zone,
+                'is_anomaly': flag,
+                'anomaly_score': score,  # Probability of anomaly
+                'energy_kwh': energy,
+                'production_units': units,
+                'shift': shift,
+                'status': status
+            }
+            for ts, zone, flag, score, energy, units, shift, status in zip(
+                timestamps, meta['zone_id'].tolist(),
+                is_anomaly.tolist(), scores.tolist(),
+                meta['energy_kwh'].astype(float).tolist(), meta['production_units'].astype(int).tolist(),
+                meta['shift'].tolist(), meta['status'].tolist()
+            )
+        ]
+    
+    def predict_anomalies(self, data_df: pd.DataFrame) -> List[Dict[str, Any]]:
+        """
+        Detect anomalies using ML model
+        
+        Args:
+            data_df: DataFrame with operational data
+            
+        Returns:
+            List of anomaly predictions with scores
+        """
+        return self.anomaly_records(self.score_anomalies(data_df))
+    
     def predict_energy(
         self, 
         historical_data: pd.DataFrame, 
@@ -232,13 +390,10 @@ class WatsonxMLClient:
         if not self.forecast_deployment_id:
             raise ValueError("FORECAST_DEPLOYMENT_ID not set in .env")
         
-        # Aggregate data by timestamp
-        ts_data = historical_data.groupby('timestamp').agg({
-            'energy_kwh': 'sum',
-            'production_units': 'sum',
-            'compressed_air_m3': 'sum',
-            'water_liters': 'sum'
-        }).reset_index().sort_values('timestamp')
+        # Aggregate data by timestamp (groupby already returns the hours in order)
+        ts_data = historical_data.groupby('timestamp')[
+            ['energy_kwh', 'production_units', 'compressed_air_m3', 'water_liters']
+        ].sum().reset_index()
         
         # Prepare features
         features_df = self.prepare_forecast_features(ts_data)
@@ -246,33 +401,50 @@ class WatsonxMLClient:
         if len(features_df) == 0:
             raise ValueError("Not enough historical data for forecasting")
         
-        # Get last row for recursive forecasting
-        last_row = features_df.iloc[-1].copy()
-        last_energy = last_row['energy_kwh']
-        last_production = last_row['production_units']
+        # Last row as a reusable feature buffer for recursive forecasting
+        feature_idx = self.forecast_feature_index
+        row = features_df.iloc[-1:].to_numpy(dtype=np.float64, copy=True)
+        last_energy = row[0, feature_idx['energy_kwh']]
+        # Assume production stays similar (or use a production forecast model)
+        last_production = row[0, feature_idx['production_units']]
         forecasts = []
         
+        # Future timestamps and their time features are known up front
+        future_timestamps = pd.date_range(
+            ts_data['timestamp'].iloc[-1] + pd.Timedelta(hours=1),
+            periods=max(hours_ahead, 0),
+            freq=pd.Timedelta(hours=1)
+        )
+        future_hours = future_timestamps.hour.tolist()
+        future_days = future_timestamps.dayofweek.tolist()
+        future_weekends = (future_timestamps.dayofweek >= 5).astype(int).tolist()
+        
+        # Reuse a recent forecast from the same seed row, start hour and horizon
+        cache_key = self._prediction_key(
+            self.forecast_deployment_id, row, ts_data['timestamp'].iloc[-1], hours_ahead
+        )
+        cached = self._cached_prediction(cache_key)
+        if cached is not None:
+            return [dict(forecast) for forecast in cached]
+        
+        # One payload, refilled with the current row each hour
+        inputs = {"fields": self.forecast_features, "values": None}
+        payload = {"input_data": [inputs]}
+        
         for hour in range(1, hours_ahead + 1):
             # Update time features for this future hour
-            future_timestamp = ts_data['timestamp'].iloc[-1] + pd.Timedelta(hours=hour)
-            last_row['hour'] = future_timestamp.hour
-            last_row['day_of_week'] = future_timestamp.dayofweek
-            last_row['is_weekend'] = 1 if future_timestamp.dayofweek in [5, 6] else 0
+            future_timestamp = future_timestamps[hour - 1]
+            row[0, feature_idx['hour']] = future_hours[hour - 1]
+            row[0, feature_idx['day_of_week']] = future_days[hour - 1]
+            row[0, feature_idx['is_weekend']] = future_weekends[hour - 1]
             
             # Update lag features with the last prediction
             # For recursive forecasting: use previous prediction as lag_1h
-            last_row['energy_lag_1h'] = last_energy
-            last_row['production_lag_1h'] = last_production
+            row[0, feature_idx['energy_lag_1h']] = last_energy
+            row[0, feature_idx['production_lag_1h']] = last_production
             
             # Prepare features
-            future_features = last_row[self.forecast_features].values.reshape(1, -1)
-            
-            payload = {
-                "input_data": [{
-                    "fields": self.forecast_features,
-                    "values": future_features.tolist()
-                }]
-            }
+            inputs["values"] = row.tolist()
             
             try:
                 response = self.client.deployments.score(
@@ -298,12 +470,10 @@ class WatsonxMLClient:
                 
                 # Update last values for next iteration
                 last_energy = predicted_energy
-                # Assume production stays similar (or use a production forecast model)
-                last_production = last_row['production_units']
                 
                 # Update other features that depend on energy
-                last_row['energy_kwh'] = predicted_energy
-                last_row['co2_kg'] = predicted_energy * 0.82
+                row[0, feature_idx['energy_kwh']] = predicted_energy
+                row[0, feature_idx['co2_kg']] = predicted_energy * 0.82
                 
                 forecasts.append({
                     'hour_ahead': hour,
@@ -314,8 +484,38 @@ class WatsonxMLClient:
             except Exception as e:
                 raise RuntimeError(f"Energy forecast failed at hour {hour}: {str(e)}")
         
+        self._store_prediction(cache_key, [dict(forecast) for forecast in forecasts])
         return forecasts
     
+    async def score_anomalies_async(self, data_df: pd.DataFrame) -> Dict[str, Any]:
+        """Async score_anomalies: the blocking SDK call runs in a worker thread"""
+        return await anyio.to_thread.run_sync(self.score_anomalies, data_df)
+    
+    async def predict_energy_async(
+        self, 
+        historical_data: pd.DataFrame, 
+        hours_ahead: int = 24
+    ) -> List[Dict[str, Any]]:
+        """Async predict_energy: the blocking SDK calls run in a worker thread"""
+        return await anyio.to_thread.run_sync(
+            partial(self.predict_energy, historical_data, hours_ahead=hours_ahead)
+        )
+    
+    def deployment_details(self, deployment_id: str) -> Dict[str, Any]:
+        """deployments.get_details, cached per deployment for model_info_ttl seconds"""
+        cached = self._details_cache.get(deployment_id)
+        if cached is not None and time.monotonic() - cached[0] < self.model_info_ttl:
+            return cached[1]
+        details = self.client.deployments.get_details(deployment_id)
+        self._details_cache[deployment_id] = (time.monotonic(), details)
+        return details
+    
+    def refresh_model_info(self) -> None:
+        """Drop cached deployment details and predictions (e.g. after a redeploy)"""
+        self._details_cache.clear()
+        with self._prediction_lock:
+            self._prediction_cache.clear()
+    
     def get_model_info(self) -> Dict[str, Any]:
         """Get information about deployed models"""
         info = {
@@ -328,18 +528,14 @@ class WatsonxMLClient:
         # Try to get deployment details
         try:
             if self.anomaly_deployment_id:
-                anomaly_details = self.client.deployments.get_details(
-                    self.anomaly_deployment_id
-                )
+                anomaly_details = self.deployment_details(self.anomaly_deployment_id)
                 info['anomaly_status'] = anomaly_details.get('entity', {}).get('status', {}).get('state')
         except:
             info['anomaly_status'] = 'unknown'
         
         try:
             if self.forecast_deployment_id:
-                forecast_details = self.client.deployments.get_details(
-                    self.forecast_deployment_id
-                )
+                forecast_details = self.deployment_details(self.forecast_deployment_id)
                 info['forecast_status'] = forecast_details.get('entity', {}).get('status', {}).get('state')
         except:
             info['forecast_status'] = 'unknown'
@@ -349,10 +545,18 @@ class WatsonxMLClient:
 
 # Singleton instance
 _wml_client = None
+_wml_client_lock = threading.Lock()
 
 def get_wml_client() -> WatsonxMLClient:
-    """Get or create WatsonxMLClient singleton"""
+    """Get or create WatsonxMLClient singleton (created once even under concurrent first calls)"""
     global _wml_client
     if _wml_client is None:
-        _wml_client = WatsonxMLClient()
+        with _wml_client_lock:
+            if _wml_client is None:
+                _wml_client = WatsonxMLClient()
     return _wml_client
+
+def refresh_wml_client() -> None:
+    """Drop the singleton's cached deployment details and predictions, if it exists yet"""
+    if _wml_client is not None:
+        _wml_client.refresh_model_info()